@@ -0,0 +1,155 @@
+"""
+Soak benchmark for the detail panes.
+
+Builds RVLoaderApp on a withdrawn root with a few fake games, drives thousands of
+selection changes through display_local_details/display_usb_details and checks that
+RSS and Tk object counts stay flat. Needs a display (or Xvfb) and the packages
+from requirements.txt:
+
+    python benchmarks/soak_selection.py --selections 10000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from ttkbootstrap import Style
+from ui.app import RVLoaderApp
+
+GAME_IDS = ["GALE01", "GM4E01", "GZLE01", "RMGE01", "RSBE01", "SOUE01"]
+WARMUP_SELECTIONS = 200
+MAX_RSS_GROWTH_MB = 20
+
+def get_rss_mb():
+    """
+    Returns the current resident set size in MB.
+    """
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def create_fixtures(base_dir):
+    """
+    Writes fake game images, their covers and a config pointing at them.
+    """
+    games_dir = os.path.join(base_dir, "games")
+    covers_dir = os.path.join(base_dir, "assets", "covers")
+    os.makedirs(games_dir)
+    os.makedirs(covers_dir)
+    paths = []
+    for title_id in GAME_IDS:
+        header = bytearray(0x440)
+        header[:6] = title_id.encode("ascii")
+        header[0x20:0x20 + len(title_id) + 5] = f"Game {title_id}".encode("ascii")
+        path = os.path.join(games_dir, f"{title_id}.iso")
+        with open(path, "wb") as f:
+            f.write(header)
+        paths.append(path)
+        Image.new("RGB", (160, 224), (len(paths) * 40, 80, 160)).save(os.path.join(covers_dir, f"{title_id}.png"))
+    with open(os.path.join(base_dir, "game_paths.json"), "w") as f:
+        json.dump({"game_folders": [{"path": games_dir, "type": "Gamecube"}]}, f)
+    return paths
+
+def count_tk_objects(app):
+    """
+    Collects the Tk object counts that grow if widgets, items or handlers leak.
+    """
+    labels = [
+        app.local_name_label, app.local_id_label, app.local_type_label,
+        app.local_region_label, app.local_version_label, app.local_path_label,
+        app.usb_name_label, app.usb_id_label, app.usb_type_label,
+        app.usb_region_label, app.usb_version_label, app.usb_path_label
+    ]
+    handlers = sum(
+        len([line for line in label.bind(sequence).splitlines() if line.strip()])
+        for label in labels for sequence in ("<Enter>", "<Leave>")
+    )
+    return {
+        "local canvas items": len(app.local_cover_canvas.find_all()),
+        "usb canvas items": len(app.usb_cover_canvas.find_all()),
+        "label handlers": handlers,
+        "root children": len(app.root.winfo_children()),
+        "tk images": len(app.root.tk.call("image", "names")),
+        "tcl commands": len(app.root.tk.call("info", "commands"))
+    }
+
+def select(app, tree, display, index):
+    """
+    Selects a row and renders its details the way <<TreeviewSelect>> would.
+    """
+    tree.selection_set(str(index))
+    display(None)
+
+def hover_tooltips(app):
+    """
+    Shows and hides every tooltip once, like a user moving over the labels.
+    """
+    for tooltip in app._tooltips.values():
+        tooltip._show_tooltip(0, 0)
+        tooltip._hide_tooltip()
+
+def run(selections):
+    """
+    Runs the soak and returns (baseline, final) measurements.
+    """
+    base_dir = tempfile.mkdtemp(prefix="rvmanager-soak-")
+    paths = create_fixtures(base_dir)
+    style = Style(theme="cosmo")
+    root = style.master
+    root.withdraw()
+    app = RVLoaderApp(root, base_dir=base_dir)
+    app.drive_monitor.stop()
+
+    app.usb_games = [
+        {"id": title_id, "name": f"Game {title_id}", "path": path, "type": "Gamecube", "disc_number": 1}
+        for title_id, path in zip(GAME_IDS, paths)
+    ]
+    for i, game in enumerate(app.usb_games):
+        app.usb_games_tree.insert("", "end", iid=str(i), values=(game["id"], game["name"], game["type"]))
+
+    def step(i):
+        select(app, app.local_games_tree, app.display_local_details, i % len(app.local_games))
+        select(app, app.usb_games_tree, app.display_usb_details, i % len(app.usb_games))
+        if i % 100 == 0:
+            hover_tooltips(app)
+            root.update()
+
+    for i in range(WARMUP_SELECTIONS):
+        step(i)
+    root.update()
+    baseline = {"rss": get_rss_mb(), **count_tk_objects(app)}
+
+    for i in range(selections):
+        step(i)
+    root.update()
+    final = {"rss": get_rss_mb(), **count_tk_objects(app)}
+    root.destroy()
+    return baseline, final
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test for detail pane selection changes.")
+    parser.add_argument("--selections", type=int, default=10000)
+    args = parser.parse_args()
+
+    baseline, final = run(args.selections)
+    for key in baseline:
+        print(f"{key:>20}: {baseline[key]:10.1f} -> {final[key]:10.1f}")
+
+    growth = final["rss"] - baseline["rss"]
+    assert growth < MAX_RSS_GROWTH_MB, f"RSS grew by {growth:.1f} MB"
+    assert final["local canvas items"] == 1, "local cover canvas items accumulate"
+    assert final["usb canvas items"] == 1, "USB cover canvas items accumulate"
+    for key in ("label handlers", "root children", "tk images", "tcl commands"):
+        assert final[key] <= baseline[key], f"{key} grew from {baseline[key]} to {final[key]}"
+    print(f"OK: {args.selections} selections, RSS growth {growth:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 from ttkbootstrap import Style
@@ -10,6 +11,7 @@ def get_base_dir():
         return os.path.dirname(__file__)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     style = Style(theme="cosmo")
     root = style.master
     root.title("RVLoader Game Manager")
@@ -1,23 +1,38 @@
+import itertools
 import os
+import queue
 import threading
-from tkinter import filedialog, messagebox, Toplevel
-from ttkbootstrap import Frame, Button, Treeview, Progressbar, Combobox, Label, Canvas
+from tkinter import filedialog, messagebox, Toplevel, BooleanVar
+from ttkbootstrap import Frame, Button, Treeview, Progressbar, Combobox, Label, Canvas, Checkbutton
+from ui.dispatcher import UIDispatcher
+from ui.gallery import CoverGallery
 from utils.config_manager import ConfigManager
 from utils.cover_manager import CoverManager
+from utils.disc_image import copy_image, get_image_size
+from utils.drive_monitor import DriveMonitor
 from utils.game_finder import GameFinder
+from utils.title_db import TitleDatabase
 from utils.usb_utils import USBUtils
+from utils.verifier import LibraryVerifier
 
 class ToolTip:
     """
     Displays a small tooltip when hovering over a widget.
+    The tooltip window is created once and reused; update the text with set_text().
     """
     def __init__(self, widget, text=""):
         self.widget = widget
         self.text = text
         self.tipwindow = None
+        self.tiplabel = None
         self.widget.bind("<Enter>", self._on_enter)
         self.widget.bind("<Leave>", self._on_leave)
 
+    def set_text(self, text):
+        self.text = text
+        if self.tiplabel:
+            self.tiplabel.config(text=text)
+
     def _on_enter(self, event=None):
         if not self.text:
             return
@@ -29,16 +44,18 @@ class ToolTip:
         self._hide_tooltip()
 
     def _show_tooltip(self, x, y):
-        self.tipwindow = tw = Toplevel(self.widget)
-        tw.wm_overrideredirect(1)
-        tw.geometry(f"+{x}+{y}")
-        label = Label(tw, text=self.text, background="#ffffe0", relief="solid", borderwidth=1)
-        label.pack(ipadx=1)
+        if self.tipwindow is None:
+            self.tipwindow = Toplevel(self.widget)
+            self.tipwindow.wm_overrideredirect(1)
+            self.tiplabel = Label(self.tipwindow, background="#ffffe0", relief="solid", borderwidth=1)
+            self.tiplabel.pack(ipadx=1)
+        self.tiplabel.config(text=self.text)
+        self.tipwindow.geometry(f"+{x}+{y}")
+        self.tipwindow.deiconify()
 
     def _hide_tooltip(self):
         if self.tipwindow:
-            self.tipwindow.destroy()
-        self.tipwindow = None
+            self.tipwindow.withdraw()
 
 
 class RVLoaderApp:
@@ -51,18 +68,36 @@ class RVLoaderApp:
         """
         self.root = root
         self.base_dir = base_dir
+        self.dispatcher = UIDispatcher(self.root)
         cfg_file = os.path.join(self.base_dir, "game_paths.json")
         covers_folder = os.path.join(self.base_dir, "assets", "covers")
 
         self.config_manager = ConfigManager(cfg_file)
         self.cover_manager = CoverManager(covers_folder)
+        self.title_db = TitleDatabase(os.path.join(self.base_dir, "assets", "titledb.idx"))
+        self.verifier = LibraryVerifier(os.path.join(self.base_dir, "verify_cache.json"))
 
         self.local_games = []
         self.usb_games = []
         self.usb_drive = None
+        self.usb_drive_labels = {}
+        self._usb_games_cache = {}
+        self._drives_reported = False
+        self._tooltips = {}
+        self.gallery = None
+        self._job_ids = itertools.count(1)
+        self._progress_owner = None
+        self._cover_requests = queue.Queue()
+        self._pending_covers = set()
+        self._cover_targets = {}
+        threading.Thread(target=self._fetch_covers, daemon=True).start()
 
         self.setup_ui()
         self.refresh_game_list()
+        self._update_title_db()
+
+        self.drive_monitor = DriveMonitor(lambda drives: self.dispatcher.post(self._on_drives_changed, drives))
+        self.drive_monitor.start()
 
     def setup_ui(self):
         """
@@ -104,12 +139,40 @@ class RVLoaderApp:
             command=self.refresh_game_list
         ).pack(side="left", padx=5)
 
+        Button(
+            left_top_frame,
+            text="Import Cover Pack",
+            bootstyle="outline-secondary",
+            command=self.import_cover_pack
+        ).pack(side="left", padx=5)
+
+        Button(
+            left_top_frame,
+            text="Set Title Database",
+            bootstyle="outline-secondary",
+            command=self.set_title_db
+        ).pack(side="left", padx=5)
+
+        Button(
+            left_top_frame,
+            text="Cover Gallery",
+            bootstyle="outline-secondary",
+            command=self.open_gallery
+        ).pack(side="left", padx=5)
+
+        Button(
+            left_top_frame,
+            text="Verify Library",
+            bootstyle="outline-secondary",
+            command=self.verify_library
+        ).pack(side="left", padx=5)
+
         Label(right_top_frame, text="USB Drive:").pack(side="left", padx=5)
         self.usb_drive_selector = Combobox(
             right_top_frame,
-            values=USBUtils.get_available_drives(),
+            values=[],
             state="readonly",
-            width=25
+            width=45
         )
         self.usb_drive_selector.pack(side="left", padx=5)
         self.usb_drive_selector.bind("<<ComboboxSelected>>", self.load_usb_games)
@@ -128,6 +191,7 @@ class RVLoaderApp:
 
         self.local_cover_canvas = Canvas(local_details_frame, width=160, height=224, bg="white")
         self.local_cover_canvas.pack()
+        self.local_cover_item = self.local_cover_canvas.create_image(0, 0, anchor="nw")
 
         self.local_name_label = Label(local_details_frame, width=40, anchor="w")
         self.local_name_label.pack(anchor="w", pady=(10, 0))
@@ -181,6 +245,13 @@ class RVLoaderApp:
         )
         copy_button.grid(row=1, column=0)
 
+        Button(
+            copy_frame,
+            text="Multi >>",
+            bootstyle="outline-danger",
+            command=self.copy_games_to_drives
+        ).grid(row=2, column=0, sticky="n", pady=5)
+
         usb_list_frame = Frame(main_frame)
         usb_list_frame.grid(row=0, column=3, sticky="nsew", padx=5, pady=5)
 
@@ -211,6 +282,7 @@ class RVLoaderApp:
 
         self.usb_cover_canvas = Canvas(details_container, width=160, height=224, bg="white")
         self.usb_cover_canvas.pack()
+        self.usb_cover_item = self.usb_cover_canvas.create_image(0, 0, anchor="nw")
 
         self.usb_name_label = Label(details_container, width=40, anchor="w")
         self.usb_name_label.pack(anchor="w", pady=(10, 0))
@@ -267,9 +339,54 @@ class RVLoaderApp:
 
     def _set_label_tooltip(self, label, tooltip_text):
         """
-        Creates a tooltip for a label.
+        Updates the label's tooltip, creating it on first use.
+        """
+        tooltip = self._tooltips.get(label)
+        if tooltip is None:
+            self._tooltips[label] = ToolTip(label, tooltip_text)
+        else:
+            tooltip.set_text(tooltip_text)
+
+    def _set_cover(self, canvas, item, cover_path):
+        """
+        Shows a cover in the canvas' single image item, or clears it.
+        """
+        cover_image = self.cover_manager.load_cover_image(cover_path) if cover_path else None
+        canvas.itemconfigure(item, image=cover_image or "")
+        canvas.image = cover_image
+
+    def _show_cover(self, canvas, item, title_id):
+        """
+        Shows the local cover at once, or queues a download and shows it if the
+        pane still displays the same title when it arrives.
+        """
+        self._cover_targets[canvas] = (item, title_id)
+        cover_path = self.cover_manager.get_local_cover(title_id)
+        self._set_cover(canvas, item, cover_path)
+        if cover_path or title_id in self._pending_covers:
+            return
+        self._pending_covers.add(title_id)
+        self._cover_requests.put(title_id)
+
+    def _fetch_covers(self):
+        """
+        Single worker that downloads queued covers one at a time.
         """
-        ToolTip(label, tooltip_text)
+        while True:
+            title_id = self._cover_requests.get()
+            cover_path = self.cover_manager.download_cover(title_id)
+            self.dispatcher.post(self._on_cover_fetched, title_id, cover_path)
+
+    def _on_cover_fetched(self, title_id, cover_path):
+        """
+        Shows a downloaded cover in every pane that still displays its title.
+        """
+        self._pending_covers.discard(title_id)
+        if not cover_path:
+            return
+        for canvas, (item, shown_id) in self._cover_targets.items():
+            if shown_id == title_id:
+                self._set_cover(canvas, item, cover_path)
 
     def add_folder(self, console_type):
         """
@@ -285,11 +402,12 @@ class RVLoaderApp:
         Reloads all local games and groups multi-disc GameCube titles.
         """
         self.local_games_tree.delete(*self.local_games_tree.get_children())
-        all_games = GameFinder.find_games(self.config_manager.get_game_folders())
+        all_games = GameFinder.find_games(self.config_manager.get_game_folders(), title_db=self.title_db)
         grouped_games = self._group_multidisc_games(all_games)
         self.local_games = grouped_games
         for i, game in enumerate(self.local_games):
             self.local_games_tree.insert("", "end", iid=str(i), values=(game["id"], game["name"], game["type"]))
+        self._update_gallery("Local Games", self.local_games)
 
     def _group_multidisc_games(self, all_games):
         """
@@ -337,18 +455,236 @@ class RVLoaderApp:
             final_list.append(data)
         return final_list
 
+    @staticmethod
+    def _format_size(num_bytes):
+        """
+        Formats a byte count for display.
+        """
+        size = float(num_bytes)
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} TB"
+
+    def _format_drive(self, drive):
+        """
+        Builds the selector label for a drive with its filesystem and free space.
+        """
+        fs_type = drive["fs_type"] or "unknown"
+        return f"{drive['path']} ({fs_type}, {self._format_size(drive['free'])} free)"
+
+    def _on_drives_changed(self, drives):
+        """
+        Updates the drive selector and preloads the game list of new drives.
+        """
+        known_paths = set(self.usb_drive_labels.values())
+        self.usb_drive_labels = {self._format_drive(d): d["path"] for d in drives}
+        current_paths = set(self.usb_drive_labels.values())
+        self.usb_drive_selector.configure(values=list(self.usb_drive_labels))
+
+        for path in set(self._usb_games_cache) - current_paths:
+            del self._usb_games_cache[path]
+        if self.usb_drive and self.usb_drive not in current_paths:
+            self.usb_drive = None
+            self.usb_games = []
+            self.usb_drive_selector.set("")
+            self.usb_games_tree.delete(*self.usb_games_tree.get_children())
+            self._update_gallery("USB Games", self.usb_games)
+        elif self.usb_drive:
+            label = next(k for k, v in self.usb_drive_labels.items() if v == self.usb_drive)
+            self.usb_drive_selector.set(label)
+
+        if self._drives_reported:
+            for path in current_paths - known_paths:
+                self._preload_usb_games(path)
+        self._drives_reported = True
+
+    def _refresh_drives(self):
+        """
+        Re-reads drive details, e.g. free space after a copy or delete.
+        """
+        self._on_drives_changed(USBUtils.get_drive_info())
+
+    def _preload_usb_games(self, path):
+        """
+        Scans a newly inserted drive in the background so it is ready when selected.
+        """
+        def perform_scan():
+            found = GameFinder.find_games([{"path": path, "type": "Unknown"}], title_db=self.title_db)
+            self.dispatcher.post(self._store_preloaded_games, path, found)
+
+        threading.Thread(target=perform_scan, daemon=True).start()
+
+    def _store_preloaded_games(self, path, found):
+        """
+        Caches a preloaded game list unless the drive is gone or already displayed.
+        """
+        if path in self.usb_drive_labels.values() and path != self.usb_drive:
+            self._usb_games_cache[path] = found
+
     def load_usb_games(self, event):
         """
         Displays the games found on the selected USB drive.
+        A preloaded list is used when the drive was just selected.
         """
         self.usb_games_tree.delete(*self.usb_games_tree.get_children())
-        self.usb_drive = self.usb_drive_selector.get()
+        self.usb_drive = self.usb_drive_labels.get(self.usb_drive_selector.get())
         if not self.usb_drive:
+            self.usb_games = []
+            self._update_gallery("USB Games", self.usb_games)
             return
-        found = GameFinder.find_games([{"path": self.usb_drive, "type": "Unknown"}])
+        found = self._usb_games_cache.pop(self.usb_drive, None)
+        if found is None or event is None:
+            found = GameFinder.find_games([{"path": self.usb_drive, "type": "Unknown"}], title_db=self.title_db)
         self.usb_games = found
         for i, game in enumerate(self.usb_games):
             self.usb_games_tree.insert("", "end", iid=str(i), values=(game["id"], game["name"], game["type"]))
+        self._update_gallery("USB Games", self.usb_games)
+
+    def import_cover_pack(self):
+        """
+        Prompts for a cover archive and imports it into the local cover store.
+        """
+        archive_path = filedialog.askopenfilename(
+            filetypes=[("Cover archives", "*.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz"), ("All files", "*.*")]
+        )
+        if not archive_path:
+            return
+        only_library = messagebox.askyesno(
+            "Import Cover Pack", "Import only covers for games in your library?"
+        )
+        title_ids = None
+        if only_library:
+            title_ids = {g["id"] for g in self.local_games} | {g["id"] for g in self.usb_games}
+
+        def perform_import():
+            try:
+                count = self.cover_manager.import_cover_pack(archive_path, title_ids)
+                self.dispatcher.post(messagebox.showinfo, "Import Cover Pack", f"Imported {count} covers.")
+            except Exception as e:
+                self.dispatcher.post(messagebox.showerror, "Import Cover Pack", f"Import error ({str(e)})")
+
+        threading.Thread(target=perform_import, daemon=True).start()
+
+    def open_gallery(self):
+        """
+        Opens the cover gallery for the local and USB game lists.
+        """
+        if self.gallery and self.gallery.window.winfo_exists():
+            self.gallery.window.lift()
+            return
+        self.gallery = CoverGallery(
+            self.root,
+            self.cover_manager,
+            {"Local Games": self.local_games, "USB Games": self.usb_games},
+            on_select=self._on_gallery_select
+        )
+
+    def _update_gallery(self, source_name, games):
+        """
+        Passes a reloaded game list to the gallery if it is open.
+        """
+        if self.gallery and self.gallery.window.winfo_exists():
+            self.gallery.set_games(source_name, games)
+
+    def _on_gallery_select(self, source_name, index):
+        """
+        Selects the game clicked in the gallery in its list.
+        """
+        tree = self.local_games_tree if source_name == "Local Games" else self.usb_games_tree
+        item = str(index)
+        if tree.exists(item):
+            tree.selection_set(item)
+            tree.see(item)
+
+    def verify_library(self):
+        """
+        Verifies all local images against a Redump/No-Intro DAT in the background.
+        """
+        dat_path = filedialog.askopenfilename(filetypes=[("DAT files", "*.dat *.xml"), ("All files", "*.*")])
+        if not dat_path:
+            return
+        throttled = messagebox.askyesno(
+            "Verify Library", "Throttle verification so it can run alongside other work?"
+        )
+        throttle_bps = self.config_manager.get_verify_throttle() if throttled else 0
+        folders = self.config_manager.get_game_folders()
+        job = self._start_progress_job("verify")
+
+        def finish_verify(results):
+            self._finish_progress_job(job)
+            self._show_verify_results(results)
+
+        def fail_verify(error):
+            self._finish_progress_job(job)
+            messagebox.showerror("Verify Library", f"Verify error ({str(error)})")
+
+        def perform_verify():
+            try:
+                dat = LibraryVerifier.load_dat(dat_path)
+                paths = [g["path"] for g in GameFinder.find_games(folders)]
+                results = self.verifier.verify(
+                    paths,
+                    dat,
+                    throttle_bps=throttle_bps,
+                    progress_callback=lambda done, total: self.dispatcher.post_progress(
+                        job, self._update_progress, job, done, total
+                    )
+                )
+                self.dispatcher.post(finish_verify, results)
+            except Exception as e:
+                self.dispatcher.post(fail_verify, e)
+
+        threading.Thread(target=perform_verify, daemon=True).start()
+
+    def _show_verify_results(self, results):
+        """
+        Shows a summary of the verification with every file that did not verify.
+        """
+        counts = {}
+        problems = []
+        for path, result in sorted(results.items()):
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+            if result["status"] != "Verified":
+                problems.append(f"{os.path.basename(path)}: {result['status']} ({result['detail']})")
+        summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+        messagebox.showinfo("Verify Results", "\n".join([summary or "No games found."] + problems[:30]))
+
+    def set_title_db(self):
+        """
+        Prompts for a GameTDB database XML (wiitdb.xml) and indexes it.
+        """
+        xml_path = filedialog.askopenfilename(filetypes=[("GameTDB database", "*.xml"), ("All files", "*.*")])
+        if not xml_path:
+            return
+        self.config_manager.set_titledb_path(xml_path)
+        self._update_title_db()
+
+    def _update_title_db(self):
+        """
+        Rebuilds the title index in the background if the configured XML changed.
+        """
+        xml_path = self.config_manager.get_titledb_path()
+        if not xml_path or not os.path.exists(xml_path) or not self.title_db.is_stale(xml_path):
+            return
+
+        def perform_build():
+            try:
+                self.title_db.build(xml_path)
+                self.dispatcher.post(self._on_title_db_ready)
+            except Exception as e:
+                self.dispatcher.post(messagebox.showerror, "Title Database", f"Index error ({str(e)})")
+
+        threading.Thread(target=perform_build, daemon=True).start()
+
+    def _on_title_db_ready(self):
+        """
+        Reloads the lists so they use the new titles.
+        """
+        self.refresh_game_list()
+        if self.usb_drive:
+            self.load_usb_games(None)
 
     def save_config(self):
         """
@@ -370,52 +706,62 @@ class RVLoaderApp:
             return
         usb_path = self.usb_drive
         selected_games = [self.local_games[int(item)] for item in selected_items]
-        self.progress["maximum"] = len(selected_games)
         self.progress["value"] = 0
-        thread = threading.Thread(target=self._copy_games_in_background, args=(selected_games, usb_path))
-        thread.start()
+        self._copy_games_in_background(selected_games, usb_path)
 
     def _show_copy_dialog(self, title, message):
         """
-        Shows a small dialog with an indeterminate progress bar.
+        Shows a small dialog with a status label and a byte progress bar.
         """
         dialog = Toplevel(self.root)
         dialog.title(title)
         dialog.geometry("400x150")
         dialog.resizable(False, False)
         dialog.grab_set()
-        Label(dialog, text=message, anchor="center").pack(pady=10)
-        progress_bar = Progressbar(dialog, mode="indeterminate")
-        progress_bar.pack(fill="x", padx=20, pady=20)
-        progress_bar.start()
+        dialog.status_label = Label(dialog, text=message, anchor="center")
+        dialog.status_label.pack(pady=10)
+        dialog.progress_bar = Progressbar(dialog, mode="determinate")
+        dialog.progress_bar.pack(fill="x", padx=20, pady=20)
         return dialog
 
     def _copy_games_in_background(self, selected_games, usb_path):
         """
-        Handles the game copying process and updates the UI.
+        Opens the copy dialog and copies the games in a worker thread.
+        The worker only posts events to the dispatcher; byte progress is coalesced.
         """
         copy_dialog = self._show_copy_dialog("Copying Games", "Initializing copy process...")
-        results = []
-        total = len(selected_games)
+        job = self._start_progress_job("copy")
 
-        def update_copy_status(index, game):
-            if index < total:
-                copy_dialog.children["!label"].config(
-                    text=f"Copying '{game['name']}' (ID: {game['id']}) to USB..."
-                )
-            else:
-                copy_dialog.destroy()
+        def update_copy_status(game):
+            copy_dialog.status_label.config(text=f"Copying '{game['name']}' (ID: {game['id']}) to USB...")
+
+        def update_copy_progress(current, total):
+            copy_dialog.progress_bar["maximum"] = max(total, 1)
+            copy_dialog.progress_bar["value"] = current
+            self._update_progress(job, current, total)
+
+        def finish_copy(results):
+            copy_dialog.destroy()
+            self._finish_progress_job(job)
+            self._show_copy_results(results)
 
         def perform_copy():
-            for i, game in enumerate(selected_games):
-                results.append(self._copy_multidisc_game(game, usb_path))
-                self.root.after(0, lambda idx=i, g=game: update_copy_status(idx + 1, g))
-            self.root.after(0, lambda: self._show_copy_results(results))
+            results = []
+            total_bytes = self._get_copy_size(selected_games)
+            copied = [0]
+
+            def on_bytes(count):
+                copied[0] += count
+                self.dispatcher.post_progress(job, update_copy_progress, copied[0], total_bytes)
 
-        thread = threading.Thread(target=perform_copy)
-        thread.start()
+            for game in selected_games:
+                self.dispatcher.post(update_copy_status, game)
+                results.append(self._copy_multidisc_game(game, usb_path, on_bytes))
+            self.dispatcher.post(finish_copy, results)
 
-    def _copy_multidisc_game(self, game, usb_path):
+        threading.Thread(target=perform_copy, daemon=True).start()
+
+    def _copy_multidisc_game(self, game, usb_path, progress_callback=None):
         """
         Copies single or multi-disc games to the USB drive.
         """
@@ -428,10 +774,12 @@ class RVLoaderApp:
                 "path": single_disc["path"],
                 "type": game["type"]
             }
-            return USBUtils.copy_game_to_usb(single_dict, usb_path, self.cover_manager)
+            return USBUtils.copy_game_to_usb(
+                single_dict, usb_path, self.cover_manager, self.title_db, progress_callback
+            )
 
         import shutil
-        destination_folder = os.path.join(usb_path, "games", game["id"])
+        destination_folder = USBUtils.get_destination_folder(game, usb_path, self.title_db)
         os.makedirs(destination_folder, exist_ok=True)
         covers_folder = os.path.join(usb_path, "rvloader", "covers")
         os.makedirs(covers_folder, exist_ok=True)
@@ -454,25 +802,164 @@ class RVLoaderApp:
             else:
                 target_file = f"disc{disc_num}.iso"
             try:
-                shutil.copy2(source_path, os.path.join(destination_folder, target_file))
+                copy_image(source_path, os.path.join(destination_folder, target_file), progress_callback=progress_callback)
             except Exception as e:
                 return f"{game['name']}: Error copying disc {disc_num} - {str(e)}"
         return f"{game['name']}: Copied successfully ({len(discs)} discs)"
 
-    def _update_copy_progress(self, current, total):
+    @staticmethod
+    def _get_copied_discs(game):
+        """
+        Returns the discs a copy writes: every disc of a GameCube game, otherwise the first.
+        """
+        if game["type"] == "Gamecube":
+            return game["discs"]
+        return game["discs"][:1]
+
+    @staticmethod
+    def _get_copy_size(games):
+        """
+        Returns the number of bytes copying the given games writes per drive.
         """
-        Updates the bottom progress bar (if needed).
+        total_bytes = 0
+        for game in games:
+            for disc in RVLoaderApp._get_copied_discs(game):
+                try:
+                    total_bytes += get_image_size(disc["path"])
+                except (OSError, ValueError):
+                    pass
+        return total_bytes
+
+    def _start_progress_job(self, name):
         """
+        Registers a background job; the first running job owns the bottom progress bar.
+        """
+        job = f"{name}-{next(self._job_ids)}"
+        if self._progress_owner is None:
+            self._progress_owner = job
+            self.progress["value"] = 0
+        return job
+
+    def _update_progress(self, job, current, total):
+        """
+        Updates the bottom progress bar if the job owns it.
+        """
+        if job != self._progress_owner:
+            return
+        self.progress["maximum"] = max(total, 1)
         self.progress["value"] = current
-        if current >= total:
+
+    def _finish_progress_job(self, job):
+        """
+        Releases and resets the bottom progress bar if the job owned it.
+        """
+        if job == self._progress_owner:
+            self._progress_owner = None
             self.progress["value"] = 0
 
+    def copy_games_to_drives(self):
+        """
+        Asks for several drives and copies the selected games to all of them at once.
+        """
+        selected_items = self.local_games_tree.selection()
+        if not selected_items:
+            messagebox.showerror("Error", "Select one or more games to copy.")
+            return
+        if not self.usb_drive_labels:
+            messagebox.showerror("Error", "No USB drives found.")
+            return
+        selected_games = [self.local_games[int(item)] for item in selected_items]
+
+        dialog = Toplevel(self.root)
+        dialog.title("Copy to Several Drives")
+        dialog.resizable(False, False)
+        dialog.grab_set()
+        Label(dialog, text="Copy the selected games to:").pack(anchor="w", padx=10, pady=(10, 5))
+        drive_vars = {}
+        for label, path in self.usb_drive_labels.items():
+            var = BooleanVar(value=path == self.usb_drive)
+            Checkbutton(dialog, text=label, variable=var).pack(anchor="w", padx=20, pady=2)
+            drive_vars[path] = var
+
+        def start_copy():
+            usb_paths = [path for path, var in drive_vars.items() if var.get()]
+            if not usb_paths:
+                messagebox.showerror("Error", "Select one or more USB drives.", parent=dialog)
+                return
+            dialog.destroy()
+            self._copy_games_to_drives_in_background(selected_games, usb_paths)
+
+        Button(dialog, text="Copy", bootstyle="outline-danger", command=start_copy).pack(pady=10)
+
+    def _copy_games_to_drives_in_background(self, selected_games, usb_paths):
+        """
+        Reads each disc once and fans it out to every drive, with per-drive progress.
+        """
+        copy_dialog = Toplevel(self.root)
+        copy_dialog.title("Copying Games")
+        copy_dialog.geometry("450x" + str(90 + 50 * len(usb_paths)))
+        copy_dialog.resizable(False, False)
+        copy_dialog.grab_set()
+        status_label = Label(copy_dialog, text="Initializing copy process...", anchor="center")
+        status_label.pack(pady=10)
+        drive_bars = {}
+        for usb_path in usb_paths:
+            Label(copy_dialog, text=usb_path, anchor="w").pack(fill="x", padx=20)
+            drive_bars[usb_path] = Progressbar(copy_dialog, mode="determinate")
+            drive_bars[usb_path].pack(fill="x", padx=20, pady=(0, 10))
+
+        job = self._start_progress_job("copy")
+
+        def update_copy_status(game):
+            status_label.config(text=f"Copying '{game['name']}' (ID: {game['id']}) to {len(usb_paths)} drives...")
+
+        def update_drive_progress(usb_path, current, total):
+            drive_bars[usb_path]["maximum"] = max(total, 1)
+            drive_bars[usb_path]["value"] = current
+
+        def finish_copy(results):
+            copy_dialog.destroy()
+            self._finish_progress_job(job)
+            for usb_path in usb_paths:
+                self._usb_games_cache.pop(usb_path, None)
+            self._show_copy_results(results)
+
+        def perform_copy():
+            total_bytes = self._get_copy_size(selected_games)
+            copied = {usb_path: 0 for usb_path in usb_paths}
+            lock = threading.Lock()
+
+            def on_bytes(usb_path, count):
+                with lock:
+                    copied[usb_path] += count
+                    current = copied[usb_path]
+                    slowest = min(copied.values())
+                self.dispatcher.post_progress((job, usb_path), update_drive_progress, usb_path, current, total_bytes)
+                self.dispatcher.post_progress(job, self._update_progress, job, slowest, total_bytes)
+
+            drive_results = {usb_path: [] for usb_path in usb_paths}
+            for game in selected_games:
+                self.dispatcher.post(update_copy_status, game)
+                game_results = USBUtils.copy_game_to_drives(
+                    game, usb_paths, self.cover_manager, self.title_db, on_bytes
+                )
+                for usb_path, message in game_results.items():
+                    drive_results[usb_path].append(message)
+            results = []
+            for usb_path in usb_paths:
+                results.append(f"[{usb_path}]")
+                results.extend(drive_results[usb_path])
+            self.dispatcher.post(finish_copy, results)
+
+        threading.Thread(target=perform_copy, daemon=True).start()
+
     def _show_copy_results(self, results):
         """
         Shows a summary of the copy process and refreshes the USB list.
         """
         messagebox.showinfo("Copy Results", "\n".join(results))
         self.load_usb_games(None)
+        self._refresh_drives()
 
     def delete_game_from_usb(self):
         """
@@ -488,12 +975,29 @@ class RVLoaderApp:
         confirm = messagebox.askyesno("Confirm Deletion", "Do you want to permanently delete the selected games?")
         if not confirm:
             return
-        results = []
-        for item in selected_items:
-            game = self.usb_games[int(item)]
-            res = USBUtils.delete_game_from_usb(game, self.usb_drive)
-            results.append(res)
+        usb_path = self.usb_drive
+        games = [self.usb_games[int(item)] for item in selected_items]
+        job = self._start_progress_job("delete")
+
+        def finish_delete(results):
+            self._finish_progress_job(job)
+            self._show_delete_results(results)
+
+        def perform_delete():
+            results = []
+            for i, game in enumerate(games):
+                results.append(USBUtils.delete_game_from_usb(game, usb_path))
+                self.dispatcher.post_progress(job, self._update_progress, job, i + 1, len(games))
+            self.dispatcher.post(finish_delete, results)
+
+        threading.Thread(target=perform_delete, daemon=True).start()
+
+    def _show_delete_results(self, results):
+        """
+        Refreshes the USB list and shows a summary of the deletion.
+        """
         self.load_usb_games(None)
+        self._refresh_drives()
         messagebox.showinfo("Deletion Results", "\n".join(results))
 
     def display_local_details(self, event):
@@ -509,16 +1013,9 @@ class RVLoaderApp:
             return
         discs_sorted = sorted(game["discs"], key=lambda d: d["disc_number"])
         first_disc = discs_sorted[0]
-        region = GameFinder.get_region(first_disc["path"])
+        region = GameFinder.get_region(first_disc["path"], self.title_db)
         version = GameFinder.get_version(first_disc["path"])
-        cover_path = self.cover_manager.download_cover(game["id"])
-
-        if cover_path:
-            cover_image = self.cover_manager.load_cover_image(cover_path)
-            self.local_cover_canvas.create_image(0, 0, anchor="nw", image=cover_image)
-            self.local_cover_canvas.image = cover_image
-        else:
-            self.local_cover_canvas.delete("all")
+        self._show_cover(self.local_cover_canvas, self.local_cover_item, game["id"])
 
         self._set_label_text(self.local_name_label,   "Name",    game["name"])
         self._set_label_text(self.local_id_label,     "ID",      game["id"])
@@ -537,16 +1034,9 @@ class RVLoaderApp:
             return
         index = int(selected_item[0])
         game = self.usb_games[index]
-        region = GameFinder.get_region(game["path"])
+        region = GameFinder.get_region(game["path"], self.title_db)
         version = GameFinder.get_version(game["path"])
-        cover_path = self.cover_manager.download_cover(game["id"])
-
-        if cover_path:
-            cover_image = self.cover_manager.load_cover_image(cover_path)
-            self.usb_cover_canvas.create_image(0, 0, anchor="nw", image=cover_image)
-            self.usb_cover_canvas.image = cover_image
-        else:
-            self.usb_cover_canvas.delete("all")
+        self._show_cover(self.usb_cover_canvas, self.usb_cover_item, game["id"])
 
         self._set_label_text(self.usb_name_label,   "Name",    game["name"])
         self._set_label_text(self.usb_id_label,     "ID",      game["id"])
@@ -0,0 +1,58 @@
+import queue
+import sys
+
+class UIDispatcher:
+    """
+    Runs callbacks posted from worker threads on the Tk main thread.
+
+    Events are drained on a fixed tick. Progress events posted with the same key
+    are merged so only the latest one per tick reaches the UI.
+    """
+    def __init__(self, root, interval_ms=33):
+        """
+        Starts draining the event queue every interval_ms (about 30 times per second).
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._events = queue.Queue()
+        self.root.after(self.interval_ms, self._drain)
+
+    def post(self, callback, *args):
+        """
+        Queues a callback to run on the main thread; safe to call from any thread.
+        """
+        self._events.put((None, callback, args))
+
+    def post_progress(self, key, callback, *args):
+        """
+        Queues a progress callback; only the newest one per key runs each tick.
+        """
+        self._events.put((key, callback, args))
+
+    def _drain(self):
+        """
+        Runs all queued callbacks in order, keeping only the latest progress event per key.
+        The next tick is scheduled first, so a callback that opens a modal dialog
+        does not stop later events from being drained while it is open.
+        """
+        self.root.after(self.interval_ms, self._drain)
+        events = []
+        latest = {}
+        while True:
+            try:
+                key, callback, args = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if key is not None:
+                if key in latest:
+                    events[latest[key]] = None
+                latest[key] = len(events)
+            events.append((callback, args))
+        for event in events:
+            if event is None:
+                continue
+            callback, args = event
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
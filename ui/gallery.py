@@ -0,0 +1,273 @@
+import math
+import queue
+import threading
+from collections import OrderedDict
+from tkinter import Toplevel
+from PIL import ImageTk
+from ttkbootstrap import Frame, Combobox, Label, Canvas, Scrollbar
+
+class CoverGallery:
+    """
+    Scrollable cover grid that only creates images for tiles in or near the viewport.
+
+    Tiles are canvas items taken from a pool and recycled while scrolling; thumbnails
+    are decoded by a background thread and fill the placeholders as they arrive.
+    """
+    TILE_WIDTH = 116
+    TILE_HEIGHT = 176
+    THUMB_SIZE = (100, 140)
+    MARGIN_ROWS = 2
+    POLL_MS = 30
+
+    def __init__(self, parent, cover_manager, sources, on_select=None):
+        """
+        Builds the gallery window; sources maps a list name to its game dicts.
+        """
+        self.cover_manager = cover_manager
+        self.sources = sources
+        self.on_select = on_select
+        self.source_name = next(iter(sources))
+        self.games = sources[self.source_name]
+
+        self._tiles = []
+        self._tile_by_index = {}
+        self._images = OrderedDict()
+        self._missing = set()
+        self._pending = set()
+        self._wanted = set()
+        self._lock = threading.Lock()
+        self._requests = queue.LifoQueue()
+        self._results = queue.Queue()
+        self._closed = False
+
+        self.window = Toplevel(parent)
+        self.window.title("Cover Gallery")
+        self.window.geometry("760x620")
+        self.window.rowconfigure(1, weight=1)
+        self.window.columnconfigure(0, weight=1)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        toolbar = Frame(self.window, padding=5)
+        toolbar.grid(row=0, column=0, columnspan=2, sticky="ew")
+        Label(toolbar, text="Show:").pack(side="left", padx=5)
+        self.source_selector = Combobox(toolbar, values=list(sources), state="readonly", width=20)
+        self.source_selector.set(self.source_name)
+        self.source_selector.pack(side="left", padx=5)
+        self.source_selector.bind("<<ComboboxSelected>>", self._on_source_selected)
+        self.count_label = Label(toolbar)
+        self.count_label.pack(side="left", padx=5)
+
+        self.canvas = Canvas(self.window, bg="white", highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        scrollbar = Scrollbar(self.window, orient="vertical", command=self._on_scrollbar)
+        scrollbar.grid(row=1, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll_units(-1))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll_units(1))
+
+        self._decoder = threading.Thread(target=self._decode_loop, daemon=True)
+        self._decoder.start()
+        self.window.after(self.POLL_MS, self._poll_results)
+
+    def close(self):
+        """
+        Stops the decoder thread and destroys the window.
+        """
+        self._closed = True
+        self._requests.put(None)
+        self.window.destroy()
+
+    def set_games(self, source_name, games):
+        """
+        Replaces the games of a source, redrawing if it is the one shown.
+        """
+        self.sources[source_name] = games
+        if source_name == self.source_name:
+            self._show_source(source_name)
+
+    def _on_source_selected(self, event):
+        self._show_source(self.source_selector.get())
+
+    def _show_source(self, source_name):
+        """
+        Switches the grid to another game list and drops all cached images.
+        """
+        self.source_name = source_name
+        self.games = self.sources[source_name]
+        for tile in self._tiles:
+            self._release_tile(tile)
+        self._tile_by_index.clear()
+        self._images.clear()
+        self._missing.clear()
+        with self._lock:
+            self._wanted = set()
+            self._pending.clear()
+        self.canvas.yview_moveto(0)
+        self._layout()
+
+    def _columns(self):
+        return max(1, self.canvas.winfo_width() // self.TILE_WIDTH)
+
+    def _layout(self):
+        """
+        Updates the scroll region for the current size and redraws visible tiles.
+        """
+        rows = math.ceil(len(self.games) / self._columns())
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), rows * self.TILE_HEIGHT))
+        self.count_label.config(text=f"{len(self.games)} games")
+        for tile in self._tiles:
+            self._release_tile(tile)
+        self._tile_by_index.clear()
+        self._update_visible()
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._update_visible()
+
+    def _on_mousewheel(self, event):
+        self._scroll_units(-1 if event.delta > 0 else 1)
+
+    def _scroll_units(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self._update_visible()
+
+    def _visible_range(self):
+        """
+        Returns the game indices in or near the viewport.
+        """
+        columns = self._columns()
+        top = self.canvas.canvasy(0)
+        first_row = max(0, int(top // self.TILE_HEIGHT) - self.MARGIN_ROWS)
+        last_row = int((top + self.canvas.winfo_height()) // self.TILE_HEIGHT) + self.MARGIN_ROWS
+        return range(first_row * columns, min(len(self.games), (last_row + 1) * columns))
+
+    def _update_visible(self):
+        """
+        Recycles tiles that left the viewport and assigns them to newly visible games.
+        """
+        visible = self._visible_range()
+        wanted = set(visible)
+        for index in list(self._tile_by_index):
+            if index not in wanted:
+                self._release_tile(self._tile_by_index.pop(index))
+        for index in list(self._images):
+            if index not in wanted:
+                del self._images[index]
+        with self._lock:
+            self._wanted = wanted
+
+        free_tiles = [tile for tile in self._tiles if tile["index"] is None]
+        for index in visible:
+            if index in self._tile_by_index:
+                continue
+            tile = free_tiles.pop() if free_tiles else self._create_tile()
+            self._assign_tile(tile, index)
+
+    def _create_tile(self):
+        """
+        Creates the canvas items of one pooled tile.
+        """
+        tile = {
+            "index": None,
+            "rect": self.canvas.create_rectangle(0, 0, 0, 0, fill="#e9ecef", outline="", state="hidden"),
+            "image": self.canvas.create_image(0, 0, anchor="n", state="hidden"),
+            "text": self.canvas.create_text(
+                0, 0, anchor="n", width=self.TILE_WIDTH - 8, font=("TkDefaultFont", 8), state="hidden"
+            )
+        }
+        for item in (tile["rect"], tile["image"], tile["text"]):
+            self.canvas.tag_bind(item, "<Button-1>", lambda event, t=tile: self._on_tile_click(t))
+        self._tiles.append(tile)
+        return tile
+
+    def _assign_tile(self, tile, index):
+        """
+        Moves a pooled tile to a game's grid cell and shows its thumbnail or a placeholder.
+        """
+        columns = self._columns()
+        game = self.games[index]
+        x = (index % columns) * self.TILE_WIDTH + self.TILE_WIDTH // 2
+        y = (index // columns) * self.TILE_HEIGHT + 4
+        thumb_w, thumb_h = self.THUMB_SIZE
+        tile["index"] = index
+        self._tile_by_index[index] = tile
+        self.canvas.coords(tile["rect"], x - thumb_w // 2, y, x + thumb_w // 2, y + thumb_h)
+        self.canvas.coords(tile["image"], x, y)
+        self.canvas.coords(tile["text"], x, y + thumb_h + 2)
+        self.canvas.itemconfigure(tile["text"], text=game["name"], state="normal")
+        self.canvas.itemconfigure(tile["rect"], state="normal")
+        image = self._images.get(index)
+        self.canvas.itemconfigure(tile["image"], image=image or "", state="normal" if image else "hidden")
+        if image is None and index not in self._missing:
+            self._request_thumbnail(index)
+
+    def _release_tile(self, tile):
+        """
+        Hides a tile and returns it to the pool.
+        """
+        tile["index"] = None
+        for item in (tile["rect"], tile["image"], tile["text"]):
+            self.canvas.itemconfigure(item, state="hidden")
+        self.canvas.itemconfigure(tile["image"], image="")
+
+    def _on_tile_click(self, tile):
+        if tile["index"] is not None and self.on_select:
+            self.on_select(self.source_name, tile["index"])
+
+    def _request_thumbnail(self, index):
+        with self._lock:
+            if index in self._pending:
+                return
+            self._pending.add(index)
+        self._requests.put((self.games, index))
+
+    def _decode_loop(self):
+        """
+        Decodes thumbnails for requests that are still visible, newest first.
+        """
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            games, index = request
+            with self._lock:
+                if games is not self.games or index not in self._wanted:
+                    self._pending.discard(index)
+                    continue
+            thumbnail = None
+            cover_path = self.cover_manager.get_local_cover(games[index]["id"])
+            if cover_path:
+                try:
+                    thumbnail = self.cover_manager.load_thumbnail(cover_path, self.THUMB_SIZE)
+                except Exception:
+                    thumbnail = None
+            self._results.put((games, index, thumbnail))
+
+    def _poll_results(self):
+        """
+        Turns decoded thumbnails into PhotoImages on the main thread.
+        """
+        if self._closed:
+            return
+        while True:
+            try:
+                games, index, thumbnail = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._pending.discard(index)
+            if games is not self.games:
+                continue
+            if thumbnail is None:
+                self._missing.add(index)
+                continue
+            tile = self._tile_by_index.get(index)
+            if tile is None:
+                continue
+            image = ImageTk.PhotoImage(thumbnail)
+            self._images[index] = image
+            self.canvas.itemconfigure(tile["image"], image=image, state="normal")
+        self.window.after(self.POLL_MS, self._poll_results)
@@ -44,3 +44,22 @@ class ConfigManager:
         normalized_folder = os.path.normpath(folder)
         if not any(f["path"] == normalized_folder for f in self.data["game_folders"]):
             self.data["game_folders"].append({"path": normalized_folder, "type": console_type})
+
+    def get_titledb_path(self):
+        """
+        Returns the configured GameTDB database XML path, or None.
+        """
+        path = self.data.get("titledb_path")
+        return os.path.normpath(path) if path else None
+
+    def set_titledb_path(self, path):
+        """
+        Sets the GameTDB database XML path.
+        """
+        self.data["titledb_path"] = os.path.normpath(path)
+
+    def get_verify_throttle(self):
+        """
+        Returns the read rate limit for throttled verification in bytes per second.
+        """
+        return int(self.data.get("verify_throttle_mbps", 40) * 1024 * 1024)
@@ -1,40 +1,206 @@
+import json
 import os
+import shutil
+import tarfile
+import threading
+import zipfile
 import requests
 from PIL import Image, ImageTk
 
+DEFAULT_REGIONS = ["US", "EN", "EU", "JP"]
+
 class CoverManager:
     """
     Handles downloading and loading cover images for games.
     """
     def __init__(self, covers_folder="assets/covers"):
         """
-        Ensures the covers folder exists.
+        Ensures the covers folder exists and loads the local cover index.
         """
         self.covers_folder = os.path.normpath(covers_folder)
         os.makedirs(self.covers_folder, exist_ok=True)
+        self.index_file = os.path.join(self.covers_folder, "index.json")
+        self.index = {}
+        self._index_lock = threading.Lock()
+        self._download_locks = {}
+        self._download_locks_lock = threading.Lock()
+        self.load_index()
 
-    def download_cover(self, title_id, regions=None):
+    def load_index(self):
         """
-        Fetches the cover image from GameTDB or returns None if not found.
+        Loads the ID -> region index of locally stored covers if it exists.
+        """
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+
+    def save_index(self):
+        """
+        Writes the local cover index next to the covers.
+        """
+        with self._index_lock:
+            tmp_file = self.index_file + ".tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(dict(self.index), f, indent=4, sort_keys=True)
+            os.replace(tmp_file, self.index_file)
+
+    def get_local_cover(self, title_id):
+        """
+        Returns the path of a locally stored cover or None without touching the network.
         """
-        if not regions:
-            regions = ["US", "EN", "EU", "JP"]
         cover_path = os.path.join(self.covers_folder, f"{title_id}.png")
         if os.path.exists(cover_path):
             return cover_path
-        for region in regions:
-            url = f"https://art.gametdb.com/wii/cover/{region}/{title_id}.png"
-            try:
-                response = requests.get(url, stream=True)
-                if response.status_code == 200:
-                    with open(cover_path, "wb") as f:
-                        for chunk in response.iter_content(1024):
-                            f.write(chunk)
-                    return cover_path
-            except:
-                pass
         return None
 
+    def download_cover(self, title_id, regions=None):
+        """
+        Returns the local cover, or fetches it from GameTDB, or None if not found.
+        Concurrent calls for the same ID wait for a single download, and the file
+        only appears under its final name once it is complete.
+        """
+        if not regions:
+            regions = DEFAULT_REGIONS
+        cover_path = self.get_local_cover(title_id)
+        if cover_path:
+            return cover_path
+        with self._download_locks_lock:
+            download_lock = self._download_locks.setdefault(title_id, threading.Lock())
+        with download_lock:
+            cover_path = self.get_local_cover(title_id)
+            if cover_path:
+                return cover_path
+            cover_path = os.path.join(self.covers_folder, f"{title_id}.png")
+            tmp_path = cover_path + ".tmp"
+            for region in regions:
+                url = f"https://art.gametdb.com/wii/cover/{region}/{title_id}.png"
+                try:
+                    response = requests.get(url, stream=True)
+                    if response.status_code == 200:
+                        with open(tmp_path, "wb") as f:
+                            for chunk in response.iter_content(1024):
+                                f.write(chunk)
+                        os.replace(tmp_path, cover_path)
+                        self.index[title_id] = region
+                        self.save_index()
+                        return cover_path
+                except:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+            return None
+
+    def import_cover_pack(self, archive_path, title_ids=None, regions=None):
+        """
+        Streams covers from a zip/tar archive of <region>/<ID>.png into the store.
+        Only IDs in title_ids are kept (all if None); regions sets the preference order.
+        Returns the number of covers written.
+        """
+        if not regions:
+            regions = DEFAULT_REGIONS
+        wanted = set(title_ids) if title_ids is not None else None
+        if zipfile.is_zipfile(archive_path):
+            imported = self._import_zip(archive_path, wanted, regions)
+        else:
+            imported = self._import_tar(archive_path, wanted, regions)
+        if imported:
+            self.save_index()
+        return imported
+
+    @staticmethod
+    def _parse_member_name(name, wanted, regions):
+        """
+        Returns (title_id, rank) for an archive member, or None if it is not wanted.
+        """
+        parts = name.replace("\\", "/").split("/")
+        if len(parts) < 2 or not parts[-1].lower().endswith(".png"):
+            return None
+        region = parts[-2].upper()
+        title_id = parts[-1][:-4]
+        if region not in regions or not title_id:
+            return None
+        if wanted is not None and title_id not in wanted:
+            return None
+        return title_id, regions.index(region)
+
+    def _is_better(self, title_id, rank, regions):
+        """
+        Checks if a cover of the given rank beats the one already stored.
+        """
+        current = self.index.get(title_id)
+        if current is None or not os.path.exists(os.path.join(self.covers_folder, f"{title_id}.png")):
+            return True
+        if current not in regions:
+            return False
+        return rank < regions.index(current)
+
+    def _store_cover(self, title_id, region, source):
+        """
+        Copies a cover stream into the store and records it in the index.
+        """
+        cover_path = os.path.join(self.covers_folder, f"{title_id}.png")
+        tmp_path = cover_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(source, f, 64 * 1024)
+        os.replace(tmp_path, cover_path)
+        self.index[title_id] = region
+
+    def _import_zip(self, archive_path, wanted, regions):
+        """
+        Picks the best region per ID from the zip directory, then streams only those members.
+        """
+        imported = 0
+        with zipfile.ZipFile(archive_path) as archive:
+            best = {}
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                parsed = self._parse_member_name(info.filename, wanted, regions)
+                if not parsed:
+                    continue
+                title_id, rank = parsed
+                if title_id not in best or rank < best[title_id][0]:
+                    best[title_id] = (rank, info)
+            for title_id, (rank, info) in best.items():
+                if not self._is_better(title_id, rank, regions):
+                    continue
+                with archive.open(info) as source:
+                    self._store_cover(title_id, regions[rank], source)
+                imported += 1
+        return imported
+
+    def _import_tar(self, archive_path, wanted, regions):
+        """
+        Streams through a (possibly compressed) tar archive in a single pass.
+        """
+        imported = set()
+        with tarfile.open(archive_path, "r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                parsed = self._parse_member_name(member.name, wanted, regions)
+                if not parsed:
+                    continue
+                title_id, rank = parsed
+                if not self._is_better(title_id, rank, regions):
+                    continue
+                source = archive.extractfile(member)
+                if source is None:
+                    continue
+                self._store_cover(title_id, regions[rank], source)
+                imported.add(title_id)
+        return len(imported)
+
+    def load_thumbnail(self, cover_path, size):
+        """
+        Decodes a cover into a resized PIL image; safe to call from a worker thread.
+        """
+        with Image.open(cover_path) as img:
+            img.draft("RGB", size)
+            return img.convert("RGBA").resize(size, Image.Resampling.BILINEAR)
+
     def load_cover_image(self, cover_path):
         """
         Loads and returns a resized cover image.
@@ -0,0 +1,399 @@
+import os
+import queue
+import shutil
+import struct
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+CISO_MAGIC = b"CISO"
+CISO_HEADER_SIZE = 0x8000
+GCZ_MAGIC = 0xB10BC001
+GCZ_HEADER = struct.Struct("<IIQQII")
+GCZ_UNCOMPRESSED_FLAG = 1 << 63
+COMPRESSED_EXTENSIONS = (".ciso", ".gcz")
+GAMECUBE_DISC_MAGIC = b"\xc2\x33\x9f\x3d"
+WII_DISC_MAGIC = b"\x5d\x1c\x9e\xa3"
+GAMECUBE_DISC_SIZE = 1459978240
+WII_SINGLE_LAYER_SIZE = 4699979776
+WII_DUAL_LAYER_SIZE = 8511160320
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
+MAX_LAG_BYTES = 256 * 1024 * 1024
+COPY_DONE = None
+COPY_ABORTED = object()
+
+class CisoReader:
+    """
+    Reads a CISO image: a 0x8000-byte header with a block map, followed by the used blocks.
+    Blocks missing from the map read as zeros, and the image is padded back to the
+    full disc size. The dropped blocks held junk data on the original disc, so a
+    scrubbed image (is_scrubbed) cannot reproduce the hash of a full dump.
+    """
+    def __init__(self, path):
+        """
+        Parses the header and block map.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        header = self.file.read(CISO_HEADER_SIZE)
+        if len(header) < CISO_HEADER_SIZE or header[:4] != CISO_MAGIC:
+            self.file.close()
+            raise ValueError(f"Not a CISO image: {path}")
+        self.block_size = struct.unpack_from("<I", header, 4)[0]
+        if self.block_size == 0:
+            self.file.close()
+            raise ValueError(f"Invalid CISO block size: {path}")
+        block_map = header[8:]
+        last_used = max((i for i, used in enumerate(block_map) if used), default=-1)
+        self._offsets = []
+        position = 0
+        for used in block_map[:last_used + 1]:
+            if used:
+                self._offsets.append(CISO_HEADER_SIZE + position * self.block_size)
+                position += 1
+            else:
+                self._offsets.append(None)
+        self.size = self._full_disc_size((last_used + 1) * self.block_size)
+        self.num_blocks = -(-self.size // self.block_size)
+        self._offsets += [None] * (self.num_blocks - len(self._offsets))
+        self.is_scrubbed = any(offset is None for offset in self._offsets)
+
+    def _full_disc_size(self, used_size):
+        """
+        Returns the standard disc size for the disc type found in block 0, or used_size.
+        """
+        if not self._offsets or self._offsets[0] is None:
+            return used_size
+        self.file.seek(self._offsets[0])
+        header = self.file.read(0x20)
+        if header[0x1C:0x20] == GAMECUBE_DISC_MAGIC:
+            return max(used_size, GAMECUBE_DISC_SIZE)
+        if header[0x18:0x1C] == WII_DISC_MAGIC:
+            if used_size <= WII_SINGLE_LAYER_SIZE:
+                return WII_SINGLE_LAYER_SIZE
+            return max(used_size, WII_DUAL_LAYER_SIZE)
+        return used_size
+
+    def read_raw_block(self, index):
+        """
+        Returns the stored data of a block, or None if the block is not stored.
+        """
+        offset = self._offsets[index]
+        if offset is None:
+            return None
+        self.file.seek(offset)
+        return self.file.read(self.block_size)
+
+    def decode_block(self, index, raw):
+        """
+        Turns stored block data into plain disc data.
+        """
+        block_length = min(self.block_size, self.size - index * self.block_size)
+        if raw is None:
+            return bytes(block_length)
+        return raw[:block_length]
+
+    def read_block(self, index):
+        return self.decode_block(index, self.read_raw_block(index))
+
+    def read(self, offset, length):
+        """
+        Reads plain disc data, touching only the blocks that cover the range.
+        """
+        return _read_range(self, offset, length)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GczReader:
+    """
+    Reads a Dolphin GCZ image: zlib-compressed blocks with a pointer table.
+    The pointer table is read on demand, so scanning a header only reads the first block.
+    """
+    def __init__(self, path):
+        """
+        Parses the header.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        header = self.file.read(GCZ_HEADER.size)
+        if len(header) < GCZ_HEADER.size:
+            self.file.close()
+            raise ValueError(f"Not a GCZ image: {path}")
+        magic, _, self.compressed_size, self.size, self.block_size, self.num_blocks = GCZ_HEADER.unpack(header)
+        if magic != GCZ_MAGIC:
+            self.file.close()
+            raise ValueError(f"Not a GCZ image: {path}")
+        if self.block_size == 0:
+            self.file.close()
+            raise ValueError(f"Invalid GCZ block size: {path}")
+        self._pointers_offset = GCZ_HEADER.size
+        self._data_offset = GCZ_HEADER.size + self.num_blocks * 12
+        self._pointers = None
+
+    def _block_pointers(self, index):
+        """
+        Returns the raw pointers of a block and of the following one (or None for the last).
+        """
+        if self._pointers is not None:
+            following = self._pointers[index + 1] if index + 1 < self.num_blocks else None
+            return self._pointers[index], following
+        count = 2 if index + 1 < self.num_blocks else 1
+        self.file.seek(self._pointers_offset + index * 8)
+        values = struct.unpack(f"<{count}Q", self.file.read(8 * count))
+        return values[0], values[1] if count == 2 else None
+
+    def load_pointers(self):
+        """
+        Reads the whole pointer table, used before streaming the full image.
+        """
+        self.file.seek(self._pointers_offset)
+        self._pointers = struct.unpack(f"<{self.num_blocks}Q", self.file.read(8 * self.num_blocks))
+
+    def read_raw_block(self, index):
+        """
+        Returns (compressed, data) for a block as stored in the file.
+        """
+        pointer, following = self._block_pointers(index)
+        start = pointer & ~GCZ_UNCOMPRESSED_FLAG
+        end = (following & ~GCZ_UNCOMPRESSED_FLAG) if following is not None else self.compressed_size
+        self.file.seek(self._data_offset + start)
+        return not pointer & GCZ_UNCOMPRESSED_FLAG, self.file.read(end - start)
+
+    def decode_block(self, index, raw):
+        """
+        Decompresses a block; safe to call from worker threads.
+        """
+        compressed, data = raw
+        if compressed:
+            data = zlib.decompress(data)
+        block_length = min(self.block_size, self.size - index * self.block_size)
+        return data[:block_length]
+
+    def read_block(self, index):
+        return self.decode_block(index, self.read_raw_block(index))
+
+    def read(self, offset, length):
+        """
+        Reads plain disc data, touching only the blocks that cover the range.
+        """
+        return _read_range(self, offset, length)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_range(reader, offset, length):
+    """
+    Assembles a byte range from the blocks of a block-based reader.
+    """
+    length = max(0, min(length, reader.size - offset))
+    data = bytearray()
+    while length > 0:
+        index, start = divmod(offset, reader.block_size)
+        block = reader.read_block(index)[start:start + length]
+        if not block:
+            break
+        data += block
+        offset += len(block)
+        length -= len(block)
+    return bytes(data)
+
+def is_compressed_image(path):
+    """
+    Checks if a path has a compressed image extension.
+    """
+    return path.lower().endswith(COMPRESSED_EXTENSIONS)
+
+def open_compressed_image(path):
+    """
+    Returns a reader for a CISO or GCZ image.
+    """
+    if path.lower().endswith(".gcz"):
+        return GczReader(path)
+    return CisoReader(path)
+
+def read_disc_header(path, offset, length):
+    """
+    Reads plain disc bytes from a compressed image without decompressing the rest.
+    """
+    with open_compressed_image(path) as reader:
+        return reader.read(offset, length)
+
+def get_image_size(path):
+    """
+    Returns the size of the plain image a game file is copied as.
+    """
+    if not is_compressed_image(path):
+        return os.path.getsize(path)
+    with open_compressed_image(path) as reader:
+        return reader.size
+
+def iter_image_chunks(source_path, workers=None, max_in_flight=None):
+    """
+    Yields the plain image data of a game file in chunks of about COPY_CHUNK_SIZE.
+    CISO/GCZ blocks are decoded on a thread pool (zlib releases the GIL) and
+    yielded in order, with at most max_in_flight blocks held in memory. By default
+    that is bounded by MAX_IN_FLIGHT_BYTES (or one block if blocks are larger),
+    and the pool is shrunk to fit the bound.
+    """
+    if not is_compressed_image(source_path):
+        with open(source_path, "rb") as src:
+            while True:
+                chunk = src.read(COPY_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+    workers = workers or os.cpu_count() or 1
+    with open_compressed_image(source_path) as reader:
+        if max_in_flight is None:
+            budget_blocks = max(1, MAX_IN_FLIGHT_BYTES // reader.block_size)
+            workers = min(workers, budget_blocks)
+            max_in_flight = max(workers, min(workers * 2, budget_blocks))
+        if isinstance(reader, GczReader):
+            reader.load_pointers()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            batch = []
+            batch_size = 0
+            for index in range(reader.num_blocks + max_in_flight):
+                if index < reader.num_blocks:
+                    raw = reader.read_raw_block(index)
+                    pending.append(pool.submit(reader.decode_block, index, raw))
+                    if len(pending) < max_in_flight:
+                        continue
+                if not pending:
+                    break
+                block = pending.popleft().result()
+                batch.append(block)
+                batch_size += len(block)
+                if batch_size >= COPY_CHUNK_SIZE:
+                    yield b"".join(batch)
+                    batch = []
+                    batch_size = 0
+            if batch:
+                yield b"".join(batch)
+
+def copy_image(source_path, destination_path, workers=None, max_in_flight=None, progress_callback=None):
+    """
+    Copies a game image, expanding CISO/GCZ into a plain image.
+    progress_callback, if given, receives the number of bytes written after each write.
+    """
+    if not is_compressed_image(source_path) and not progress_callback:
+        shutil.copy2(source_path, destination_path)
+        return
+    tmp_path = destination_path + ".part"
+    try:
+        with open(tmp_path, "wb") as out:
+            for chunk in iter_image_chunks(source_path, workers, max_in_flight):
+                out.write(chunk)
+                if progress_callback:
+                    progress_callback(len(chunk))
+        shutil.copystat(source_path, tmp_path)
+        os.replace(tmp_path, destination_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_chunks(chunks, destination_path, progress_callback):
+    """
+    Writer thread body for copy_image_multi: writes queued chunks until COPY_DONE,
+    then renames the .part file into place. On COPY_ABORTED the .part file is removed
+    and the destination is left untouched. After an error it keeps draining the
+    queue so the reader is never blocked.
+    """
+    tmp_path = destination_path + ".part"
+    error = None
+    out = None
+    try:
+        out = open(tmp_path, "wb")
+    except Exception as e:
+        error = e
+    while True:
+        chunk = chunks.get()
+        if chunk is COPY_DONE or chunk is COPY_ABORTED:
+            break
+        if error is not None:
+            continue
+        try:
+            out.write(chunk)
+            if progress_callback:
+                progress_callback(destination_path, len(chunk))
+        except Exception as e:
+            error = e
+    if out is not None:
+        out.close()
+    if error is None and chunk is COPY_DONE:
+        try:
+            os.replace(tmp_path, destination_path)
+        except Exception as e:
+            error = e
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    return error
+
+def _run_writer(chunks, destination_path, progress_callback, errors):
+    """
+    Thread target that stores the result of _write_chunks for its destination.
+    """
+    errors[destination_path] = _write_chunks(chunks, destination_path, progress_callback)
+
+def copy_image_multi(source_path, destination_paths, progress_callback=None, max_lag_bytes=MAX_LAG_BYTES):
+    """
+    Copies one game image to several destinations, reading the source only once.
+    Each destination has a writer thread fed by its own bounded queue of shared
+    chunks, so a slow drive may fall up to max_lag_bytes behind before the reader
+    waits for it. If the source cannot be read, existing destination files are kept.
+    progress_callback receives (destination_path, bytes written).
+    Returns {destination_path: None or the error for that destination}.
+    """
+    max_chunks = max(1, max_lag_bytes // COPY_CHUNK_SIZE)
+    queues = {path: queue.Queue(maxsize=max_chunks) for path in destination_paths}
+    errors = {}
+    writers = []
+    for path, chunks in queues.items():
+        thread = threading.Thread(target=_run_writer, args=(chunks, path, progress_callback, errors), daemon=True)
+        thread.start()
+        writers.append(thread)
+    read_error = None
+    end_marker = COPY_ABORTED
+    try:
+        for chunk in iter_image_chunks(source_path):
+            for chunks in queues.values():
+                chunks.put(chunk)
+        end_marker = COPY_DONE
+    except Exception as e:
+        read_error = e
+    finally:
+        for chunks in queues.values():
+            chunks.put(end_marker)
+        for thread in writers:
+            thread.join()
+    results = {}
+    for path in destination_paths:
+        if read_error is not None:
+            results[path] = read_error
+            continue
+        results[path] = errors.get(path)
+        if results[path] is None:
+            try:
+                shutil.copystat(source_path, path)
+            except OSError:
+                pass
+    return results
@@ -0,0 +1,87 @@
+import os
+import select
+import threading
+from utils.usb_utils import USBUtils, MOUNTINFO_PATH
+
+class DriveMonitor:
+    """
+    Watches the mount table in a background thread and reports drive changes.
+    """
+    def __init__(self, on_change, poll_interval=2.0):
+        """
+        Stores the callback, which receives the list from USBUtils.get_drive_info().
+        """
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Starts the monitor thread and reports the current drives once.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the monitor thread.
+        """
+        self._stop_event.set()
+
+    def _run(self):
+        """
+        Reports drives whenever the set of mounted drives changes.
+        """
+        drives = USBUtils.get_drive_info()
+        self.on_change(drives)
+        known = {(d["path"], d["fs_type"]) for d in drives}
+        mountinfo = self._open_mountinfo()
+        try:
+            while not self._stop_event.is_set():
+                changed = self._wait_for_change(mountinfo)
+                if self._stop_event.is_set():
+                    break
+                if not changed:
+                    continue
+                drives = USBUtils.get_drive_info()
+                current = {(d["path"], d["fs_type"]) for d in drives}
+                if current != known:
+                    known = current
+                    self.on_change(drives)
+        finally:
+            if mountinfo:
+                mountinfo.close()
+
+    @staticmethod
+    def _open_mountinfo():
+        """
+        Opens the mount table for change notification where poll() supports it.
+        """
+        if os.name == "nt" or not hasattr(select, "poll") or not os.path.exists(MOUNTINFO_PATH):
+            return None
+        try:
+            f = open(MOUNTINFO_PATH, "r")
+            f.read()
+            return f
+        except OSError:
+            return None
+
+    def _wait_for_change(self, mountinfo):
+        """
+        Blocks until the kernel flags a mount table change or one poll interval passes.
+        Returns True if the drives should be rescanned.
+        """
+        if mountinfo is None:
+            self._stop_event.wait(self.poll_interval)
+            return True
+        poller = select.poll()
+        poller.register(mountinfo, select.POLLPRI | select.POLLERR)
+        if not poller.poll(int(self.poll_interval * 1000)):
+            return False
+        mountinfo.seek(0)
+        mountinfo.read()
+        return True
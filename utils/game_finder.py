@@ -1,4 +1,30 @@
 import os
+import struct
+import zlib
+from utils.disc_image import COMPRESSED_EXTENSIONS, is_compressed_image, read_disc_header
+
+REGION_CODES = {
+    "E": "USA",
+    "P": "Europe",
+    "J": "Japan",
+    "K": "Korea",
+    "W": "Taiwan",
+    "D": "Germany",
+    "F": "France",
+    "I": "Italy",
+    "S": "Spain",
+    "H": "Netherlands",
+    "U": "Australia",
+    "X": "Europe",
+    "Y": "Europe",
+    "Z": "Europe",
+    "L": "Europe",
+    "M": "Europe",
+    "N": "USA",
+    "Q": "Korea",
+    "T": "Korea",
+    "R": "Russia"
+}
 
 def get_disc_number_iso_offset_6(iso_path):
     """
@@ -6,26 +32,30 @@ def get_disc_number_iso_offset_6(iso_path):
     """
     if not os.path.isfile(iso_path):
         return 1
-    with open(iso_path, "rb") as f:
-        f.seek(6)
-        disc_byte = f.read(1)
-        if not disc_byte:
-            return 1
-        val = disc_byte[0]
-        if val == 0x00:
-            return 1
-        elif val == 0x01:
-            return 2
+    return _disc_number_from_byte(GameFinder.read_header(iso_path, 6, 1))
+
+def _disc_number_from_byte(disc_byte):
+    """
+    Maps the disc number byte (0x00/0x01) to 1 or 2.
+    """
+    if not disc_byte:
+        return 1
+    val = disc_byte[0]
+    if val == 0x00:
         return 1
+    elif val == 0x01:
+        return 2
+    return 1
 
 class GameFinder:
     """
-    Finds and extracts metadata from .iso or .wbfs files.
+    Finds and extracts metadata from .iso, .wbfs, .ciso or .gcz files.
     """
     @staticmethod
-    def find_games(folders, extensions=(".iso", ".wbfs")):
+    def find_games(folders, extensions=(".iso", ".wbfs") + COMPRESSED_EXTENSIONS, title_db=None):
         """
         Searches for valid game files under the specified folders.
+        Names are taken from title_db when it knows the ID; unreadable files are skipped.
         """
         games = []
         for folder in folders:
@@ -35,19 +65,25 @@ class GameFinder:
                     if file.lower().endswith(extensions):
                         game_path = os.path.normpath(os.path.join(root, file))
                         console_type = GameFinder.get_console_type(folder_path, root, file, folder["type"])
-                        games.append(GameFinder.extract_game_info(game_path, console_type))
+                        try:
+                            games.append(GameFinder.extract_game_info(game_path, console_type, title_db))
+                        except (OSError, ValueError, struct.error, zlib.error):
+                            continue
         return games
 
     @staticmethod
-    def extract_game_info(game_path, console_type):
+    def extract_game_info(game_path, console_type, title_db=None):
         """
         Extracts title ID, name, type, and disc number from a game file.
         """
-        title_id = GameFinder.get_title_id(game_path)
-        game_name = GameFinder.get_game_name(game_path)
+        header = GameFinder.read_header(game_path, 0, 0x60)
+        title_id = header[:6].decode("ascii", errors="ignore")
+        game_name = header[0x20:0x60].decode("ascii", errors="ignore").strip("\x00").strip()
+        if title_db:
+            game_name = title_db.get_title(title_id, game_name)
         disc_number = 1
         if console_type == "Gamecube":
-            disc_number = get_disc_number_iso_offset_6(game_path)
+            disc_number = _disc_number_from_byte(header[6:7])
         return {
             "id": title_id,
             "name": game_name,
@@ -56,25 +92,31 @@ class GameFinder:
             "disc_number": disc_number
         }
 
+    @staticmethod
+    def read_header(game_path, offset, length):
+        """
+        Reads disc header bytes; WBFS headers start at 0x200 and CISO/GCZ
+        images are decoded from their first block only.
+        """
+        if is_compressed_image(game_path):
+            return read_disc_header(game_path, offset, length)
+        with open(game_path, "rb") as f:
+            f.seek(offset + (0x200 if game_path.lower().endswith(".wbfs") else 0x0))
+            return f.read(length)
+
     @staticmethod
     def get_title_id(game_path):
         """
         Retrieves the first 6 bytes from offset 0x0 (ISO) or 0x200 (WBFS).
         """
-        with open(game_path, "rb") as f:
-            offset = 0x0 if game_path.lower().endswith(".iso") else 0x200
-            f.seek(offset)
-            return f.read(6).decode("ascii", errors="ignore")
+        return GameFinder.read_header(game_path, 0x0, 6).decode("ascii", errors="ignore")
 
     @staticmethod
     def get_game_name(game_path):
         """
         Retrieves up to 64 bytes for the internal game name.
         """
-        with open(game_path, "rb") as f:
-            offset = 0x20 if game_path.lower().endswith(".iso") else 0x220
-            f.seek(offset)
-            return f.read(64).decode("ascii", errors="ignore").strip("\x00").strip()
+        return GameFinder.read_header(game_path, 0x20, 64).decode("ascii", errors="ignore").strip("\x00").strip()
 
     @staticmethod
     def get_console_type(base_folder, root, file_name, default_type):
@@ -93,25 +135,22 @@ class GameFinder:
         return "Unknown"
 
     @staticmethod
-    def get_region(game_path):
+    def get_region(game_path, title_db=None):
         """
-        Reads offset 0x03 to determine the region code.
+        Returns the region from title_db, or from the region letter of the title ID.
         """
-        with open(game_path, "rb") as f:
-            f.seek(0x03)
-            region_code = f.read(1)
-            regions = {
-                b'\x00': "Japan",
-                b'\x01': "USA",
-                b'\x02': "Europe"
-            }
-            return regions.get(region_code, "Unknown")
+        title_id = GameFinder.get_title_id(game_path)
+        if title_db:
+            entry = title_db.lookup(title_id)
+            if entry and entry["region"]:
+                return entry["region"]
+        if len(title_id) < 4:
+            return "Unknown"
+        return REGION_CODES.get(title_id[3], "Unknown")
 
     @staticmethod
     def get_version(game_path):
         """
         Reads offset 0x07 to determine the disc version.
         """
-        with open(game_path, "rb") as f:
-            f.seek(0x07)
-            return int.from_bytes(f.read(1), "big")
+        return int.from_bytes(GameFinder.read_header(game_path, 0x07, 1), "big")
@@ -0,0 +1,170 @@
+import mmap
+import os
+import struct
+import threading
+import xml.etree.ElementTree as ET
+
+INDEX_MAGIC = b"RVTDB001"
+HEADER = struct.Struct("<8sIqq")
+RECORD = struct.Struct("<6sII")
+FIELD_SEPARATOR = "\x1f"
+
+class TitleDatabase:
+    """
+    Compact ID -> title lookup index built from a GameTDB database XML (wiitdb.xml).
+
+    The index file holds a header, fixed-size records sorted by ID and a string
+    table. It is memory-mapped on first lookup and searched with a binary search.
+    """
+    def __init__(self, index_file="assets/titledb.idx"):
+        """
+        Stores the index location; nothing is read until the first lookup.
+        """
+        self.index_file = os.path.normpath(index_file)
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+        self._count = 0
+        self._loaded = False
+
+    def is_stale(self, xml_path):
+        """
+        Checks if the index is missing or was built from a different XML file.
+        """
+        try:
+            stat = os.stat(xml_path)
+            with open(self.index_file, "rb") as f:
+                magic, _, mtime, size = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return True
+        return magic != INDEX_MAGIC or mtime != stat.st_mtime_ns or size != stat.st_size
+
+    def build(self, xml_path):
+        """
+        Streams the XML with iterparse and writes a fresh index. Returns the number of titles.
+        """
+        entries = {}
+        context = ET.iterparse(xml_path, events=("start", "end"))
+        _, root = next(context)
+        for event, elem in context:
+            if event != "end" or elem.tag != "game":
+                continue
+            entry = self._parse_game(elem)
+            if entry:
+                entries[entry[0]] = entry[1]
+            root.clear()
+
+        stat = os.stat(xml_path)
+        records = []
+        strings = bytearray()
+        for title_id in sorted(entries):
+            data = FIELD_SEPARATOR.join(entries[title_id]).encode("utf-8")
+            records.append(RECORD.pack(title_id.encode("ascii"), len(strings), len(data)))
+            strings += data
+
+        os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(HEADER.pack(INDEX_MAGIC, len(records), stat.st_mtime_ns, stat.st_size))
+            f.write(b"".join(records))
+            f.write(strings)
+        with self._lock:
+            self._close()
+            os.replace(tmp_file, self.index_file)
+        return len(records)
+
+    @staticmethod
+    def _parse_game(elem):
+        """
+        Extracts (id, (title, region, languages, size)) from a <game> element.
+        """
+        title_id = (elem.findtext("id") or "").strip()
+        if not title_id or len(title_id) > 6 or not title_id.isascii():
+            return None
+        title = None
+        fallback = None
+        for locale in elem.iter("locale"):
+            text = (locale.findtext("title") or "").strip()
+            if not text:
+                continue
+            if locale.get("lang") == "EN":
+                title = text
+                break
+            if fallback is None:
+                fallback = text
+        title = title or fallback or elem.get("name", "")
+        region = (elem.findtext("region") or "").strip()
+        languages = (elem.findtext("languages") or "").strip()
+        rom = elem.find("rom")
+        size = rom.get("size", "") if rom is not None else ""
+        return title_id, (title, region, languages, size)
+
+    def _open(self):
+        """
+        Memory-maps the index file if it exists.
+        """
+        self._loaded = True
+        try:
+            self._file = open(self.index_file, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count, _, _ = HEADER.unpack_from(self._map, 0)
+            if magic != INDEX_MAGIC:
+                raise ValueError("Invalid title index")
+            self._count = count
+        except (OSError, ValueError, struct.error):
+            self._close()
+            self._loaded = True
+
+    def _close(self):
+        """
+        Releases the memory map so the index can be replaced.
+        """
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._map = None
+        self._count = 0
+        self._loaded = False
+
+    def lookup(self, title_id):
+        """
+        Returns a dict with title, region, languages and size, or None if unknown.
+        """
+        if not title_id:
+            return None
+        key = title_id.strip("\x00").encode("ascii", errors="ignore").ljust(6, b"\x00")[:6]
+        with self._lock:
+            if not self._loaded:
+                self._open()
+            if self._map is None:
+                return None
+            low, high = 0, self._count - 1
+            while low <= high:
+                mid = (low + high) // 2
+                record_id, offset, length = RECORD.unpack_from(self._map, HEADER.size + mid * RECORD.size)
+                if record_id < key:
+                    low = mid + 1
+                elif record_id > key:
+                    high = mid - 1
+                else:
+                    start = HEADER.size + self._count * RECORD.size + offset
+                    data = self._map[start:start + length].decode("utf-8")
+                    title, region, languages, size = data.split(FIELD_SEPARATOR)
+                    return {
+                        "title": title,
+                        "region": region,
+                        "languages": languages.split(",") if languages else [],
+                        "size": int(size) if size.isdigit() else None
+                    }
+        return None
+
+    def get_title(self, title_id, default=None):
+        """
+        Returns the proper title for an ID or the given default.
+        """
+        entry = self.lookup(title_id)
+        if entry and entry["title"]:
+            return entry["title"]
+        return default
@@ -1,5 +1,13 @@
 import os
+import re
 import shutil
+from utils.disc_image import copy_image, copy_image_multi
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+MOUNT_ROOTS = ("/media", "/run/media", "/mnt")
+USER_MOUNT_ROOTS = ("/media", "/run/media")
+SYS_BLOCK_PATH = "/sys/class/block"
+INVALID_FOLDER_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
 class USBUtils:
     """
@@ -10,27 +18,184 @@ class USBUtils:
         """
         Returns all available drives on the system.
         """
+        return [drive["path"] for drive in USBUtils.get_drive_info()]
+
+    @staticmethod
+    def get_drive_info():
+        """
+        Returns path, filesystem type, free and total bytes for every available drive.
+        """
         if os.name == "nt":
-            return [os.path.normpath(f"{chr(d)}:/") for d in range(65, 91) if os.path.exists(f"{chr(d)}:/")]
+            mounts = [
+                (os.path.normpath(f"{chr(d)}:/"), USBUtils._get_windows_fs_type(f"{chr(d)}:\\"))
+                for d in range(65, 91) if os.path.exists(f"{chr(d)}:/")
+            ]
         else:
-            return [os.path.normpath(os.path.join("/media", d)) for d in os.listdir("/media") if os.path.isdir(os.path.join("/media", d))]
+            mounts = USBUtils.get_removable_mounts()
+        drives = []
+        for path, fs_type in mounts:
+            try:
+                usage = shutil.disk_usage(path)
+            except OSError:
+                continue
+            drives.append({"path": path, "fs_type": fs_type, "free": usage.free, "total": usage.total})
+        return drives
+
+    @staticmethod
+    def get_removable_mounts(mountinfo_path=MOUNTINFO_PATH):
+        """
+        Parses the mount table for removable block devices mounted under /media, /run/media or /mnt.
+        """
+        try:
+            with open(mountinfo_path, "r") as f:
+                text = f.read()
+        except OSError:
+            return USBUtils._list_mount_roots()
+        mounts = []
+        for line in text.splitlines():
+            fields = line.split()
+            if "-" not in fields:
+                continue
+            separator = fields.index("-")
+            if len(fields) < 5 or separator + 1 >= len(fields):
+                continue
+            mount_point = USBUtils._unescape_mount_path(fields[4])
+            if not any(mount_point.startswith(root + "/") for root in MOUNT_ROOTS):
+                continue
+            source = fields[separator + 2] if separator + 2 < len(fields) else ""
+            if USBUtils._is_removable_device(source):
+                mounts.append((os.path.normpath(mount_point), fields[separator + 1]))
+        return mounts
+
+    @staticmethod
+    def _is_removable_device(source):
+        """
+        Checks whether a mount source is a partition of a removable or USB-attached disk.
+        """
+        if not source.startswith("/dev/"):
+            return False
+        name = os.path.basename(os.path.realpath(source))
+        device = os.path.realpath(os.path.join(SYS_BLOCK_PATH, name))
+        if not os.path.isdir(device):
+            return False
+        if os.path.exists(os.path.join(device, "partition")):
+            device = os.path.dirname(device)
+        try:
+            with open(os.path.join(device, "removable"), "r") as f:
+                if f.read().strip() == "1":
+                    return True
+        except OSError:
+            pass
+        return "/usb" in device
 
     @staticmethod
-    def copy_game_to_usb(game, usb_path, cover_manager):
+    def _unescape_mount_path(path):
+        """
+        Decodes the octal escapes (e.g. \\040 for a space) used in the mount table.
+        """
+        return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), path)
+
+    @staticmethod
+    def _list_mount_roots():
+        """
+        Falls back to listing /media and /run/media when no mount table is available.
+        Desktop automounters put drives one level down, under a directory per user.
+        """
+        drives = []
+        for root in USER_MOUNT_ROOTS:
+            if not os.path.isdir(root):
+                continue
+            for d in os.listdir(root):
+                path = os.path.join(root, d)
+                if os.path.ismount(path):
+                    drives.append((os.path.normpath(path), ""))
+                elif os.path.isdir(path):
+                    try:
+                        labels = os.listdir(path)
+                    except OSError:
+                        continue
+                    for label in labels:
+                        label_path = os.path.join(path, label)
+                        if os.path.ismount(label_path):
+                            drives.append((os.path.normpath(label_path), ""))
+        return drives
+
+    @staticmethod
+    def _get_windows_fs_type(drive_root):
+        """
+        Returns the filesystem name of a Windows drive, or an empty string.
+        """
+        try:
+            import ctypes
+            fs_name = ctypes.create_unicode_buffer(32)
+            ok = ctypes.windll.kernel32.GetVolumeInformationW(
+                ctypes.c_wchar_p(drive_root), None, 0, None, None, None, fs_name, len(fs_name)
+            )
+            return fs_name.value if ok else ""
+        except Exception:
+            return ""
+
+    @staticmethod
+    def get_gamecube_folder_name(game, title_db=None):
+        """
+        Returns "<Title> [<ID>]" when title_db knows the game, otherwise the ID.
+        """
+        title = title_db.get_title(game["id"]) if title_db else None
+        if title:
+            title = INVALID_FOLDER_CHARS.sub("", title).strip().rstrip(".")
+        if not title:
+            return game["id"]
+        return f"{title} [{game['id']}]"
+
+    @staticmethod
+    def get_destination_folder(game, usb_path, title_db=None):
+        """
+        Returns the folder a game is copied to, or None for unknown console types.
+        """
+        console_type = game["type"]
+        if console_type == "Wii":
+            return os.path.join(usb_path, "wbfs")
+        if console_type == "Gamecube":
+            games_path = os.path.join(usb_path, "games")
+            existing = USBUtils._find_gamecube_folder(games_path, game["id"])
+            if existing:
+                return existing
+            return os.path.join(games_path, USBUtils.get_gamecube_folder_name(game, title_db))
+        return None
+
+    @staticmethod
+    def _find_gamecube_folder(games_path, game_id):
+        """
+        Returns an existing "games/<ID>" or "games/<Title> [<ID>]" folder so a game
+        already on the drive is not copied a second time under a new name.
+        """
+        plain = os.path.join(games_path, game_id)
+        if os.path.isdir(plain):
+            return plain
+        try:
+            names = sorted(os.listdir(games_path))
+        except OSError:
+            return None
+        suffix = f"[{game_id}]"
+        for name in names:
+            path = os.path.join(games_path, name)
+            if name.endswith(suffix) and os.path.isdir(path):
+                return path
+        return None
+
+    @staticmethod
+    def copy_game_to_usb(game, usb_path, cover_manager, title_db=None, progress_callback=None):
         """
         Copies a game file and its cover to the target USB folder.
+        progress_callback receives the number of bytes written after each write.
         """
         try:
-            console_type = game["type"]
-            if console_type == "Wii":
-                destination_folder = os.path.join(usb_path, "wbfs")
-            elif console_type == "Gamecube":
-                destination_folder = os.path.join(usb_path, "games", game["id"])
-            else:
+            destination_folder = USBUtils.get_destination_folder(game, usb_path, title_db)
+            if not destination_folder:
                 return f"{game['name']}: Unknown console type"
 
             os.makedirs(destination_folder, exist_ok=True)
-            shutil.copy2(game["path"], os.path.join(destination_folder, "game.iso"))
+            copy_image(game["path"], os.path.join(destination_folder, "game.iso"), progress_callback=progress_callback)
 
             covers_folder = os.path.join(usb_path, "rvloader", "covers")
             os.makedirs(covers_folder, exist_ok=True)
@@ -47,6 +212,73 @@ class USBUtils:
         except Exception as e:
             return f"{game['name']}: Copy error ({str(e)})"
 
+    @staticmethod
+    def copy_game_to_drives(game, usb_paths, cover_manager, title_db=None, progress_callback=None):
+        """
+        Copies a (possibly multi-disc) game to several drives, reading each disc once.
+        progress_callback receives (usb_path, bytes written). Returns {usb_path: message}.
+        """
+        results = {}
+        targets = {}
+        for usb_path in usb_paths:
+            destination_folder = USBUtils.get_destination_folder(game, usb_path, title_db)
+            if not destination_folder:
+                results[usb_path] = f"{game['name']}: Unknown console type"
+                continue
+            try:
+                os.makedirs(destination_folder, exist_ok=True)
+            except OSError as e:
+                results[usb_path] = f"{game['name']}: Copy error ({str(e)})"
+                continue
+            targets[usb_path] = destination_folder
+
+        discs = sorted(game["discs"], key=lambda d: d["disc_number"])
+        multidisc = game["type"] == "Gamecube" and len(discs) > 1
+        if not multidisc:
+            discs = discs[:1]
+        for d in discs:
+            if not targets:
+                break
+            disc_num = d["disc_number"]
+            target_file = f"disc{disc_num}.iso" if multidisc and disc_num != 1 else "game.iso"
+            destinations = {os.path.join(folder, target_file): usb for usb, folder in targets.items()}
+
+            def on_bytes(path, count):
+                if progress_callback:
+                    progress_callback(destinations[path], count)
+
+            for path, error in copy_image_multi(d["path"], list(destinations), on_bytes).items():
+                if error is None:
+                    continue
+                usb_path = destinations[path]
+                if multidisc:
+                    results[usb_path] = f"{game['name']}: Error copying disc {disc_num} - {str(error)}"
+                else:
+                    results[usb_path] = f"{game['name']}: Copy error ({str(error)})"
+                del targets[usb_path]
+
+        downloaded_cover = None
+        if targets:
+            downloaded_cover = cover_manager.download_cover(game["id"])
+        for usb_path in targets:
+            covers_folder = os.path.join(usb_path, "rvloader", "covers")
+            cover_path = os.path.join(covers_folder, f"{game['id']}.png")
+            if not os.path.exists(cover_path):
+                if not downloaded_cover:
+                    results[usb_path] = f"{game['name']}: Copied game, but cover not found"
+                    continue
+                try:
+                    os.makedirs(covers_folder, exist_ok=True)
+                    shutil.copy2(downloaded_cover, cover_path)
+                except Exception as e:
+                    results[usb_path] = f"{game['name']}: Cover copy error - {str(e)}"
+                    continue
+            if multidisc:
+                results[usb_path] = f"{game['name']}: Copied successfully ({len(discs)} discs)"
+            else:
+                results[usb_path] = f"{game['name']}: Copied successfully"
+        return results
+
     @staticmethod
     def delete_game_from_usb(game, usb_path):
         """
@@ -57,7 +289,9 @@ class USBUtils:
             if console_type == "Wii":
                 folder = os.path.join(usb_path, "wbfs")
             elif console_type == "Gamecube":
-                folder = os.path.join(usb_path, "games", game["id"])
+                folder = os.path.dirname(game["path"])
+                if os.path.dirname(folder) != os.path.join(usb_path, "games"):
+                    folder = os.path.join(usb_path, "games", game["id"])
             else:
                 return f"{game['name']}: Unknown console type"
             if os.path.exists(folder):
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils.disc_image import CisoReader, is_compressed_image, iter_image_chunks
+
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+PER_DEVICE_WORKERS = 2
+CACHE_FORMAT = 2
+UNCHECKABLE_EXTENSIONS = (".wbfs",)
+
+def _lower_priority():
+    """
+    Pool initializer that lowers the worker's CPU priority where supported.
+    """
+    if hasattr(os, "nice"):
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+
+def _iter_file_chunks(path):
+    """
+    Yields the raw bytes of a plain image.
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+def hash_file(path, throttle_bps=0):
+    """
+    Returns (path, crc32, sha1, size) of the plain image, optionally capping the read rate.
+    CISO/GCZ images are hashed as their decoded stream. Runs inside pool worker processes.
+    """
+    crc = 0
+    sha1 = hashlib.sha1()
+    started = time.monotonic()
+    read = 0
+    if is_compressed_image(path):
+        chunks = iter_image_chunks(path, workers=1)
+    else:
+        chunks = _iter_file_chunks(path)
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        sha1.update(chunk)
+        read += len(chunk)
+        if throttle_bps:
+            ahead = read / throttle_bps - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+    return path, f"{crc:08x}", sha1.hexdigest(), read
+
+class LibraryVerifier:
+    """
+    Hashes game images in a process pool and matches them against a Redump/No-Intro DAT.
+    Hashes are cached by (path, size, mtime) so unchanged files are not read again.
+    """
+    def __init__(self, cache_file="verify_cache.json"):
+        """
+        Loads the hash cache if present.
+        """
+        self.cache_file = os.path.normpath(cache_file)
+        self.cache = {}
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, "r") as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+
+    def save_cache(self):
+        """
+        Writes the hash cache to disk.
+        """
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(self.cache, f, indent=4)
+        os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def load_dat(dat_path):
+        """
+        Streams a Logiqx XML DAT into lookups by SHA-1, by (CRC32, size) and by ROM name.
+        """
+        by_sha1 = {}
+        by_crc = {}
+        by_name = {}
+        context = ET.iterparse(dat_path, events=("start", "end"))
+        _, root = next(context)
+        for event, elem in context:
+            if event != "end" or elem.tag not in ("game", "machine"):
+                continue
+            game_name = elem.get("name", "")
+            for rom in elem.iter("rom"):
+                entry = {"game": game_name, "name": rom.get("name", ""), "size": rom.get("size", "")}
+                if rom.get("sha1"):
+                    by_sha1[rom.get("sha1").lower()] = entry
+                if rom.get("crc"):
+                    by_crc[(rom.get("crc").lower(), entry["size"])] = entry
+                if entry["name"]:
+                    by_name[os.path.splitext(entry["name"])[0].lower()] = entry
+            root.clear()
+        return {"sha1": by_sha1, "crc": by_crc, "name": by_name}
+
+    @staticmethod
+    def get_worker_count(paths, per_device=PER_DEVICE_WORKERS):
+        """
+        Sizes the pool to the CPU count, capped by the number of distinct disks.
+        """
+        devices = set()
+        for path in paths:
+            try:
+                devices.add(os.stat(path).st_dev)
+            except OSError:
+                pass
+        disk_workers = max(1, len(devices)) * per_device
+        return max(1, min(os.cpu_count() or 1, disk_workers))
+
+    def _cached_hash(self, path, stat):
+        """
+        Returns the cached hashes for a file if its size and mtime are unchanged.
+        """
+        entry = self.cache.get(path)
+        if (entry and entry.get("format") == CACHE_FORMAT
+                and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns):
+            return entry
+        return None
+
+    def verify(self, paths, dat, throttle_bps=0, progress_callback=None, max_workers=None):
+        """
+        Hashes every path (new or changed files only) and returns {path: result}.
+        With throttle_bps the total read rate is capped and workers run at low priority.
+        Workers are spawned rather than forked, since the app runs other threads.
+        Images that cannot be compared with a DAT (WBFS, scrubbed CISO) are reported
+        as "Not checkable".
+        """
+        results = {}
+        to_hash = []
+        stats = {}
+        for path in paths:
+            if path.lower().endswith(UNCHECKABLE_EXTENSIONS):
+                results[path] = {"status": "Not checkable", "detail": "WBFS images cannot be matched against a DAT"}
+                continue
+            if self._is_scrubbed_ciso(path):
+                results[path] = {"status": "Not checkable", "detail": "Scrubbed CISO images cannot be matched against a DAT"}
+                continue
+            try:
+                stats[path] = os.stat(path)
+            except OSError as e:
+                results[path] = {"status": "Error", "detail": str(e)}
+                continue
+            cached = self._cached_hash(path, stats[path])
+            if cached:
+                results[path] = self._match(path, cached, dat)
+            else:
+                to_hash.append(path)
+
+        total = len(paths)
+        done = total - len(to_hash)
+        if progress_callback:
+            progress_callback(done, total)
+        if to_hash:
+            workers = max_workers or self.get_worker_count(to_hash)
+            worker_bps = throttle_bps // workers if throttle_bps else 0
+            try:
+                initializer = _lower_priority if throttle_bps else None
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initializer
+                ) as pool:
+                    futures = {
+                        pool.submit(hash_file, path, worker_bps): path
+                        for path in to_hash
+                    }
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        try:
+                            _, crc, sha1, plain_size = future.result()
+                            stat = stats[path]
+                            entry = {
+                                "format": CACHE_FORMAT,
+                                "size": stat.st_size,
+                                "mtime": stat.st_mtime_ns,
+                                "plain_size": plain_size,
+                                "crc32": crc,
+                                "sha1": sha1
+                            }
+                            self.cache[path] = entry
+                            results[path] = self._match(path, entry, dat)
+                        except Exception as e:
+                            results[path] = {"status": "Error", "detail": str(e)}
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total)
+            finally:
+                self.save_cache()
+        return results
+
+    @staticmethod
+    def _is_scrubbed_ciso(path):
+        """
+        Checks if a CISO image dropped any blocks; only its header is read.
+        """
+        if not path.lower().endswith(".ciso"):
+            return False
+        try:
+            with CisoReader(path) as reader:
+                return reader.is_scrubbed
+        except (OSError, ValueError, struct.error):
+            return False
+
+    @staticmethod
+    def _match(path, hashes, dat):
+        """
+        Classifies a file as verified, bad dump or not in the DAT.
+        """
+        entry = dat["sha1"].get(hashes["sha1"]) or dat["crc"].get((hashes["crc32"], str(hashes["plain_size"])))
+        if entry:
+            return {"status": "Verified", "detail": entry["game"]}
+        entry = dat["name"].get(os.path.splitext(os.path.basename(path))[0].lower())
+        if entry:
+            return {"status": "Bad dump", "detail": f"Hash differs from {entry['game']}"}
+        return {"status": "Not in DAT", "detail": hashes["sha1"]}